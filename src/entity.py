@@ -5,15 +5,96 @@ Entity classes for representing GEDCOM data structures.
 from typing import List
 from typing import Optional
 from datetime import datetime
+import functools
+import operator
+import re
 from dateutil.parser import parse
 
 from src import enums
 
+# Bound once at import so constructors and jsonify skip the module attribute lookups
+_SEX_UNKNOWN: enums.Sex = enums.Sex.UNKNOWN
+_SEX_TO_STR: dict[enums.Sex, str] = enums.sex_to_str
+_NAME_TO_STR: dict[enums.NameType, str] = enums.name_to_str
+
+# C implemented accessors used to build the per-entity lists in jsonify
+_GET_INDI_ID = operator.attrgetter('indi_id')
+_JSONIFY = operator.methodcaller('jsonify')
+
+# Upper case three letter month abbreviations (JAN, FEB, ...) to month numbers
+_MONTH_ABBREVIATIONS: dict[str, int] = {
+    name[:3].upper(): number for number, name in enums.months.items()
+}
+
+
+# Matches exact dates such as `12 JAN 1901` with an optional approximation qualifier
+# (ABT, BEF, AFT, EST, CAL). Years below 1000 are left to dateutil since it reads
+# zero padded years like 0050 as two digit years.
+_EXACT_DATE_PATTERN: re.Pattern[str] = re.compile(
+    r'\s*(?:(?:ABT|BEF|AFT|EST|CAL)\s+)?(\d{1,2})\s+([A-Z]{3})\s+([1-9]\d{3})\s*',
+    re.IGNORECASE | re.ASCII
+)
+
+
+def _is_iso_date(date_str: str) -> bool:
+    '''
+    Checks whether a string has the strict ISO `YYYY-MM-DD` shape with a year of 1000 or later.
+    Earlier years are left to dateutil, which maps two-digit looking years like 0050 to 2050.
+
+    Args:
+        date_str (str): The raw date string from a DATE record.
+
+    Returns:
+        bool: True if the string can be handed to datetime.fromisoformat.
+    '''
+    return (len(date_str) == 10 and date_str.isascii() and date_str[0] != '0'
+            and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit())
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_gedcom_date(date_str: str) -> Optional[datetime]:
+    '''
+    Parses a GEDCOM date string into a datetime.
+
+    Exact dates in the common GEDCOM form `DD MON YYYY` (i.e. 12 JAN 1901 or ABT 12 JAN 1901)
+    are built directly, as are ISO `YYYY-MM-DD` dates written by some exporting tools. Everything
+    else falls back to the fuzzy dateutil parser. Partial dates must go through dateutil
+    because it fills the missing fields from today's date.
+    Results are cached since the same date strings repeat throughout a file.
+
+    Args:
+        date_str (str): The raw date string from a DATE record.
+
+    Returns:
+        Optional[datetime]: The parsed datetime, or None if the string cannot be parsed.
+    '''
+    match: re.Match[str] | None = _EXACT_DATE_PATTERN.fullmatch(date_str)
+    if match:
+        day, month, year = match.groups()
+        month_number: int | None = _MONTH_ABBREVIATIONS.get(month.upper())
+        if month_number:
+            try:
+                return datetime(int(year), month_number, int(day))
+            except ValueError:
+                pass
+    elif _is_iso_date(date_str):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    try:
+        return parse(date_str, fuzzy=True)
+    except ValueError:
+        return None
+
 
 class Address:
     '''
     Represents an address.
     '''
+    __slots__ = ('_addresses', 'city', 'state', 'postal', 'country')
+
     def __init__(self):
         self._addresses: List[str] = []
         self.city: str = ''
@@ -29,7 +110,7 @@ class Address:
             JSON serializable object
         '''
         return {
-            'addresses': list(addr for addr in self._addresses),
+            'addresses': self._addresses.copy(),
             'city': self.city,
             'state': self.state,
             'postal': self.postal,
@@ -45,22 +126,15 @@ class Address:
         self._addresses.append(addr)
 
     def __str__(self):
-        parts: list[str] = []
-        if self.city:
-            parts.append(self.city)
-        if self.state:
-            parts.append(self.state)
-        if self.postal:
-            parts.append(self.postal)
-        if self.country:
-            parts.append(self.country)
-        return ' '.join(parts)
+        return ' '.join(filter(None, (self.city, self.state, self.postal, self.country)))
 
 
 class Place:
     '''
     Represents a place.
     '''
+    __slots__ = ('name', 'latitude', 'longitude')
+
     def __init__(self):
         self.name: Optional[str] = None
         self.latitude: Optional[str] = None
@@ -73,7 +147,7 @@ class Place:
         Returns:
             JSON serializable object or empty string
         '''
-        if not self.name and not self.latitude and not self.longitude:
+        if not (self.name or self.latitude or self.longitude):
             return ''
 
         return {
@@ -87,8 +161,12 @@ class Event:
     '''
     Represents an event in a person's life.
     '''
+    __slots__ = ('event_type', 'classification', 'date', 'address', 'place', 'note')
+
     def __init__(self, event_type: str | None = None):
         self.event_type: str | None = event_type
+        # Descriptive classification from a TYPE sub-record, i.e. Stillborn for a BIRT event
+        self.classification: str | None = None
         self.date: Date | None = None
         self.address: Address | None = None
         self.place: Place | None = None
@@ -98,28 +176,35 @@ class Event:
         '''
         Returns a JSON serializable representation of the event.
         If no date or address is set, returns an empty string.
+        Only the date, place, address, and note keys that are set are included.
         Returns:
             JSON serializable object or empty string
         '''
-        if not self.date and not self.address:
+        if not (self.date or self.address):
             return ''
 
-        return {
-            'type': self.event_type,
-            'date': self.date.jsonify() if self.date else None,
-            'place': self.place.jsonify() if self.place else None,
-            'address': self.address.jsonify() if self.address else None,
-            'note': self.note
-        }
+        event_obj: dict[str, object] = {'type': self.event_type}
+        if self.date:
+            event_obj['date'] = self.date.jsonify()
+        if self.place:
+            event_obj['place'] = self.place.jsonify()
+        if self.address:
+            event_obj['address'] = self.address.jsonify()
+        if self.note:
+            event_obj['note'] = self.note
+        return event_obj
 
 
 class Date:
     '''
     Represents a date which can be parsed from a string.
     '''
+    __slots__ = ('_raw_date_str', '_date', '_date_str')
+
     def __init__(self, date: str | None = None):
         self._raw_date_str: str | None = date
         self._date: Optional[datetime] = None
+        self._date_str: Optional[str] = None
         if date:
             self._parse_date()
 
@@ -177,19 +262,21 @@ class Date:
     def _parse_date(self) -> None:
         if not self._raw_date_str:
             return
-        try:
-            self._date = parse(self._raw_date_str, fuzzy=True)
-        except ValueError:
-            pass
+        self._date = _parse_gedcom_date(self._raw_date_str)
+        self._date_str = None
 
     def __str__(self):
-        return self._date.strftime('%Y-%m-%d') if self._date else ''
+        if self._date_str is None:
+            self._date_str = self._date.date().isoformat() if self._date else ''
+        return self._date_str
 
 
 class Header:
     '''
     Represents the header of a GEDCOM file.
     '''
+    __slots__ = ('source', 'date', 'gedcom_version', 'submission', 'submitter')
+
     def __init__(self):
         self.source: Optional[str] = None
         self.date: Optional[Date] = None
@@ -221,6 +308,19 @@ class Individual:
         '''
         Represents a name of an individual, which can have multiple parts.
         '''
+        __slots__ = ('type', 'unstructured_name_parts', 'surname', 'prefix',
+                     'given', 'nickname', 'surname_prefix', 'suffix')
+
+        # (attribute, JSON part type) pairs in the order parts are emitted by jsonify
+        _PART_SPECS: tuple[tuple[str, str], ...] = (
+            ('surname', 'Surname'),
+            ('prefix', 'Prefix'),
+            ('given', 'Given'),
+            ('nickname', 'Nickname'),
+            ('surname_prefix', 'SurnamePrefix'),
+            ('suffix', 'Suffix')
+        )
+
         def __init__(self, name_type: enums.NameType = enums.NameType.MAIN):
             # Enum data.NameType
             self.type: enums.NameType = name_type
@@ -245,43 +345,26 @@ class Individual:
             Returns:
                 JSON serializable object with type, name, and parts
             '''
-            parts_list: List[object] = []
-
-            if self.surname:
-                parts_list.append(
-                    {'type': 'Surname', 'value': self.surname})
-
-            if self.prefix:
-                parts_list.append(
-                    {'type': 'Prefix', 'value': self.prefix})
-
-            if self.given:
-                parts_list.append(
-                    {'type': 'Given', 'value': self.given})
-
-            if self.nickname:
-                parts_list.append(
-                    {'type': 'Nickname', 'value': self.nickname})
-
-            if self.surname_prefix:
-                parts_list.append(
-                    {'type': 'SurnamePrefix', 'value': self.surname_prefix})
-
-            if self.suffix:
-                parts_list.append(
-                    {'type': 'Suffix', 'value': self.suffix})
+            parts_list: List[object] = [
+                {'type': label, 'value': value}
+                for attr, label in self._PART_SPECS
+                if (value := getattr(self, attr))
+            ]
 
             return {
-                'type': enums.name_to_str[self.type.value],
-                'name': ' '.join(self.unstructured_name_parts) if len(self.unstructured_name_parts) > 0 else None,
+                'type': _NAME_TO_STR[self.type],
+                'name': ' '.join(self.unstructured_name_parts) if self.unstructured_name_parts else None,
                 'parts': parts_list if len(parts_list) > 0 else None
             }
 
+    __slots__ = ('indi_id', 'names', 'sex', '_events', 'dead', 'parent1', 'parent2')
+
     def __init__(self, indi_id: Optional[str] = None):
         self.indi_id: Optional[str] = indi_id
         self.names: List[Individual.Name] = []
-        self.sex: enums.Sex = enums.Sex.UNKNOWN
-        self._events: List[Event] = []
+        self.sex: enums.Sex = _SEX_UNKNOWN
+        # Allocated by the first add_event call, so individuals without events hold no list
+        self._events: Optional[List[Event]] = None
         self.dead: bool = False
 
         self.parent1: Optional[Individual] = None
@@ -293,12 +376,14 @@ class Individual:
         Returns:
             JSON serializable object
         '''
+        names: List[Individual.Name] = self.names
+        events: Optional[List[Event]] = self._events
         return {
             'id': self.indi_id,
-            'names': [name.jsonify() for name in self.names],
-            'sex': enums.sex_to_str[self.sex.value],
+            'names': list(map(_JSONIFY, names)) if names else [],
+            'sex': _SEX_TO_STR[self.sex],
             'is_dead': self.dead,
-            'events': [event.jsonify() for event in self._events],
+            'events': list(map(_JSONIFY, events)) if events else [],
         }
 
     def add_event(self, event: Event) -> None:
@@ -307,6 +392,8 @@ class Individual:
         Args:
             event (Event): The event to add.
         '''
+        if self._events is None:
+            self._events = []
         self._events.append(event)
 
 
@@ -314,11 +401,14 @@ class Family:
     '''
     Represents a family in a GEDCOM file, which can have two parents and multiple children.
     '''
+    __slots__ = ('fam_id', 'parent1', 'parent2', '_children')
+
     def __init__(self, fam_id: Optional[str] = None):
         self.fam_id: Optional[str] = fam_id
         self.parent1: Optional[Individual] = None
         self.parent2: Optional[Individual] = None
-        self._children: List[Individual] = []
+        # Allocated by the first add_child call, so childless families hold no list
+        self._children: Optional[List[Individual]] = None
 
     def jsonify(self) -> object:
         '''
@@ -330,7 +420,7 @@ class Family:
             'id': self.fam_id,
             'parent1': self.parent1.indi_id if self.parent1 else None,
             'parent2': self.parent2.indi_id if self.parent2 else None,
-            'children': [child.indi_id for child in self._children] if len(self._children) > 0 else None
+            'children': list(map(_GET_INDI_ID, self._children)) if self._children else None
         }
 
     def add_child(self, child: Individual) -> None:
@@ -338,6 +428,8 @@ class Family:
         Adds a child to the family.
         Args:
             child (Individual): The child to add.'''
+        if self._children is None:
+            self._children = []
         self._children.append(child)
 
 
@@ -345,6 +437,9 @@ class Record:
     '''
     Represents a record in a GEDCOM file.
     '''
+    __slots__ = ('level', 'tag', 'line_value', 'cross_ref_id', 'cross_ref_ptr', 'ignorable',
+                 'child_records', 'individual')
+
     def __init__(self, level: int):
         self.level: int = level
         self.tag: str = ''  # Enum data.Tag
@@ -360,17 +455,6 @@ class Record:
         self.individual: Optional[Individual] = None
 
     def __str__(self):
-        record_str = str(self.level) + ' '
-
-        if self.cross_ref_id:
-            record_str += self.cross_ref_id + ' '
-
-        if self.tag:
-            record_str += self.tag + ' '
-
-        if self.line_value:
-            record_str += self.line_value
-        elif self.cross_ref_ptr:
-            record_str += self.cross_ref_ptr
-
-        return record_str
+        cross_ref_id: str = f'{self.cross_ref_id} ' if self.cross_ref_id else ''
+        tag: str = f'{self.tag} ' if self.tag else ''
+        return f'{self.level} {cross_ref_id}{tag}{self.line_value or self.cross_ref_ptr}'
@@ -199,6 +199,8 @@ class ObsoleteTag(StrEnum):
     FSID = 'FSID'
 
 
+# Keyed by the plain tag strings rather than Tag members so lookups with the str
+# tags from parsed records keep the exact-str dict fast path
 indi_event_type = {
     Tag.BIRT.value: 'Birth',
     Tag.DEAT.value: 'Death',
@@ -224,11 +226,11 @@ indi_event_type = {
 }
 
 sex_to_str = {
-    'M': 'Male',
-    'F': 'Female',
-    'U': 'Unknown',
-    'X': 'Intersex',
-    'N': 'Not Record'
+    Sex.MALE: 'Male',
+    Sex.FEMALE: 'Female',
+    Sex.UNKNOWN: 'Unknown',
+    Sex.INTERSEX: 'Intersex',
+    Sex.NOT_RECORDED: 'Not Record'
 }
 
 months = {
@@ -247,10 +249,10 @@ months = {
 }
 
 name_to_str = {
-    'main': 'Main',
-    'aka': 'Also Known As',
-    'birth': 'Birth',
-    'immigrant': 'Immigrant',
-    'maiden': 'Maiden',
-    'married': 'Married'
+    NameType.MAIN: 'Main',
+    NameType.AKA: 'Also Known As',
+    NameType.BIRTH: 'Birth',
+    NameType.IMMIGRANT: 'Immigrant',
+    NameType.MAIDEN: 'Maiden',
+    NameType.MARRIED: 'Married'
 }
@@ -5,6 +5,10 @@ This module provides the File class for reading, parsing, and converting GEDCOM
 from typing import List
 from typing import Dict
 from typing import Any
+from typing import Tuple
+from typing import BinaryIO
+from typing import Iterator
+import functools
 import io
 import errno
 import sys
@@ -15,50 +19,166 @@ from src.parse_engine import ParseEngine
 from src import entity
 from src import enums
 
+
+def _jsonify_default(obj: Any) -> Any:
+    '''
+    Encoder hook for objects the JSON backends cannot serialize natively. Entities
+    are converted with their own `jsonify` while the encoder walks the output, so
+    only one entity's dict tree is alive at a time.
+    '''
+    if hasattr(obj, 'jsonify'):
+        return obj.jsonify()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+# Prefer the C implemented orjson encoder when it is installed, falling
+# back to the standard library. Both backends emit byte-identical UTF-8
+# output, compact or indented by two spaces when `pretty` is set. Other
+# encoders are deliberately not used because their output differs, i.e.
+# ujson escapes '/' as '\/' by default.
+try:
+    import orjson
+
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, default=_jsonify_default,
+                            option=orjson.OPT_INDENT_2 if pretty else None)
+except ImportError:
+    # Shared encoders avoid rebuilding one on each per-entity call in File.dump.
+    # The entity dicts are plain trees, so the circular reference check is not needed.
+    _JSON_ENCODER: json.JSONEncoder = json.JSONEncoder(
+        ensure_ascii=False, check_circular=False, separators=(',', ':'),
+        default=_jsonify_default)
+    _PRETTY_JSON_ENCODER: json.JSONEncoder = json.JSONEncoder(
+        ensure_ascii=False, check_circular=False, indent=2, default=_jsonify_default)
+
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        encoder: json.JSONEncoder = _PRETTY_JSON_ENCODER if pretty else _JSON_ENCODER
+        return encoder.encode(obj).encode('utf-8')
+
+# File.dump flushes its output buffer whenever it grows past this many bytes
+_DUMP_CHUNK_SIZE: int = 256 * 1024
+
+# Byte order marks recognized at the start of a file, checked longest first
+# since the single NUL mark is a prefix of the 32-bit big endian one
+_BYTE_ORDER_MARKS: Dict[bytes, enums.ByteOrderMark] = {
+    b'\x00\x00\xfe\xff': enums.ByteOrderMark.BIG_ENDIAN_32_BIT,
+    b'\xef\xbb\xbf': enums.ByteOrderMark.LITTLE_ENDIAN_32_BIT,
+    b'\xff\xfe': enums.ByteOrderMark.LITTLE_ENDIAN_16_BIT,
+    b'\xfe\xff': enums.ByteOrderMark.BIG_ENDIAN_16_BIT,
+    b'\x00': enums.ByteOrderMark.BIT_8,
+}
+_BYTE_ORDER_MARK_LENGTHS: Tuple[int, ...] = tuple(sorted({len(bom) for bom in _BYTE_ORDER_MARKS}, reverse=True))
+_MAX_BYTE_ORDER_MARK_LENGTH: int = _BYTE_ORDER_MARK_LENGTHS[0]
+
+
 class File:
     '''
     Represents a GEDCOM file and provides methods to JSONify the information.
     Initializing the class will parse the GEDCOM file and methods like `jsonify`
     will convert the parsed data into JSON format. 
+
+    By default the whole file, including the header, individuals, and families, is
+    validated during initialization, so an invalid file exits the program before any
+    output is written. Passing `eager=False` defers building the header, individuals,
+    and families to first use. Errors such as an invalid NAME or SEX, or a family
+    pointing at a missing individual, then exit the program partway through `jsonify`,
+    `dump`, or `print_individuals`. With `dump` that happens after the caller has
+    already opened (and truncated) the destination file. A section that is never used
+    is never validated, i.e. `jsonify(JSONField.IND)` does not check family pointers.
+    Call `validate` before writing anything when using `eager=False`.
     '''
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, eager: bool = True):
         self.filepath: str = filepath
         self._byte_order_mark: enums.ByteOrderMark = enums.ByteOrderMark.NONE
 
-        self._raw_file_lines: List[str] = []
-        self._load_from_file()
-
         self._engine: ParseEngine = ParseEngine()
 
         self._records: List[entity.Record] = self._engine.run(
-            lambda: self._engine.parse_raw_lines(self._raw_file_lines))
-        self._header: entity.Header | None = self._engine.run(
-            self._engine.parse_header)
-        self._individuals: List[entity.Individual] | None = self._engine.run(
-            self._engine.parse_indi_records)
-        self._families: List[entity.Family] | None = self._engine.run(
-            self._engine.parse_fam_records)
+            lambda: self._engine.parse_raw_lines(self._iter_lines()))
+
+        if eager:
+            self.validate()
+
+    def validate(self) -> None:
+        '''
+        Builds and validates the header, individuals, and families immediately. Only
+        needed when the file was opened with `eager=False`. Like any other parse error,
+        an invalid record prints the error and exits the program.
+        '''
+        _ = self._header
+        _ = self._families
+
+    # The entities below are built from the parsed records on first access,
+    # so callers only pay for the sections they actually use.
+
+    @functools.cached_property
+    def _header(self) -> entity.Header | None:
+        return self._engine.run(self._engine.parse_header)
+
+    @functools.cached_property
+    def _individuals(self) -> List[entity.Individual] | None:
+        return self._engine.run(self._engine.parse_indi_records)
+
+    @functools.cached_property
+    def _families(self) -> List[entity.Family] | None:
+        # Families link to the Individual entities, which must be built first
+        if self._individuals is None:
+            return None
+        return self._engine.run(self._engine.parse_fam_records)
 
 
-    def jsonify(self, *fields: enums.JSONField) -> str:
+    def jsonify(self, *fields: enums.JSONField, pretty: bool = False) -> str:
         '''
         Converts the parsed GEDCOM data into a JSON string. This is stored in a file with
         the filename passed in during initialization (i.e. royal92.ged is jsonified to royal92.json).
         Without providing `fields`, the JSON string will contain all information parsed. If
-        any `fields` are provided, it will only include those specified fields.
+        any `fields` are provided, it will only include those specified fields. The output is
+        compact unless `pretty` is True, in which case it is indented by two spaces.
         '''
-        json_obj: Dict[str, Any] = {}
+        return _dumps(self._build_json_obj(fields), pretty).decode('utf-8')
+
+    def dump(self, fp: BinaryIO, *fields: enums.JSONField) -> None:
+        '''
+        Writes the parsed GEDCOM data as UTF-8 encoded JSON to `fp`, which must be opened
+        in binary mode. The output is identical to `jsonify`, but each individual and family
+        is encoded on its own and flushed in chunks, so memory use stays bounded by a single
+        entity rather than the whole document.
+        '''
+        buffer: bytearray = bytearray(b'{')
+        for i, (key, entities) in enumerate(self._json_sections(fields)):
+            if i > 0:
+                buffer += b','
+            buffer += _dumps(key)
+            buffer += b':['
+            for j, item in enumerate(entities):
+                if j > 0:
+                    buffer += b','
+                buffer += _dumps(item)
+                if len(buffer) >= _DUMP_CHUNK_SIZE:
+                    fp.write(buffer)
+                    buffer.clear()
+            buffer += b']'
+        buffer += b'}'
+        fp.write(buffer)
+
+    def _build_json_obj(self, fields: Tuple[enums.JSONField, ...]) -> Dict[str, Any]:
+        # Entities are left for the encoder's default hook to jsonify one at a time
+        return dict(self._json_sections(fields))
+
+    def _json_sections(self, fields: Tuple[enums.JSONField, ...]) \
+        -> List[Tuple[str, List[entity.Individual] | List[entity.Family]]]:
+        sections: List[Tuple[str, List[entity.Individual] | List[entity.Family]]] = []
 
         if (len(fields) == 0 or enums.JSONField.IND in fields) \
             and self._individuals and len(self._individuals) > 0:
-            json_obj['individuals'] = [indi.jsonify() for indi in self._individuals]
+            sections.append(('individuals', self._individuals))
 
         if (len(fields) == 0 or enums.JSONField.FAM in fields) \
             and self._families and len(self._families) > 0:
-            json_obj['families'] = [fam.jsonify() for fam in self._families]
+            sections.append(('families', self._families))
 
-        return json.dumps(json_obj)
+        return sections
 
     def print_individuals(self) -> None:
         '''
@@ -75,23 +195,26 @@ class File:
         If `show_hierarchy` is True, it will print each line with a number of leading spaces equal
         to the level value of the record.
         '''
-        for record in self._records:
-            self._print_records_helper(record, 0, show_hierarchy)
-
-    def _print_records_helper(self, record: entity.Record, level: int, show_hierarchy: bool) -> None:
-        if show_hierarchy:
-            print(' ' * level, end='')
-        print(record)
-        for child in record.child_records:
-            self._print_records_helper(child, level + 1, show_hierarchy)
-
-    def _load_from_file(self) -> None:
+        # Walk the record tree with an explicit stack and write the output in one call
+        lines: List[str] = []
+        stack: List[Tuple[entity.Record, int]] = [(record, 0) for record in reversed(self._records)]
+        while stack:
+            record, level = stack.pop()
+            if show_hierarchy:
+                lines.append(' ' * level)
+            lines.append(str(record))
+            lines.append('\n')
+            stack.extend((child, level + 1) for child in reversed(record.child_records))
+        sys.stdout.write(''.join(lines))
+
+    def _iter_lines(self) -> Iterator[str]:
+        # Lines are yielded straight to the parse engine so the file is never held in memory
         try:
             path: str = self.filepath
             with open(path, mode='r', encoding='utf-8') as fp:
                 self._strip_byte_order_mark(fp)
                 for line in fp:
-                    self._raw_file_lines.append(line.rstrip('\n\r'))
+                    yield line.rstrip('\n\r')
         except IOError as e:
             if e.errno == errno.ENOENT:
                 print(
@@ -107,17 +230,12 @@ class File:
                 sys.exit(os.EX_OSFILE)
 
     def _strip_byte_order_mark(self, fp: io.TextIOWrapper) -> None:
-        bom: bytes = fp.read(1).encode('utf-8')
-        if bom == b'\xef\xbb\xbf':
-            self._byte_order_mark = enums.ByteOrderMark.LITTLE_ENDIAN_32_BIT
-        elif bom == b'\x00\x00\xfe\xff':
-            self._byte_order_mark = enums.ByteOrderMark.BIG_ENDIAN_32_BIT
-        elif bom == b'\xff\xfe':
-            self._byte_order_mark = enums.ByteOrderMark.LITTLE_ENDIAN_16_BIT
-        elif bom == b'\xfe\xff':
-            self._byte_order_mark = enums.ByteOrderMark.BIG_ENDIAN_16_BIT
-        elif bom == b'\x00':
-            self._byte_order_mark = enums.ByteOrderMark.BIT_8
-        else:
-            self._byte_order_mark = enums.ByteOrderMark.NONE
-            fp.seek(0)
+        # Peek at the raw bytes so the mark is matched before any text is decoded
+        head: bytes = fp.buffer.peek(_MAX_BYTE_ORDER_MARK_LENGTH)[:_MAX_BYTE_ORDER_MARK_LENGTH]
+        for length in _BYTE_ORDER_MARK_LENGTHS:
+            bom: enums.ByteOrderMark | None = _BYTE_ORDER_MARKS.get(head[:length])
+            if bom is not None:
+                fp.buffer.read(length)
+                self._byte_order_mark = bom
+                return
+        self._byte_order_mark = enums.ByteOrderMark.NONE
@@ -6,6 +6,7 @@ from typing import List
 from typing import Optional
 from typing import Callable
 from typing import Any
+from typing import Iterable
 import sys
 
 from src import entity
@@ -73,11 +74,12 @@ class ParseEngine:
             warnings += f'[WARNING {i+1}] {w}\n'
         return (len(self._warnings), warnings)
 
-    def parse_raw_lines(self, raw_file_lines: List[str]) -> List[entity.Record] | None:
+    def parse_raw_lines(self, raw_file_lines: Iterable[str]) -> List[entity.Record] | None:
         '''
-        Parses a list of raw GEDCOM file lines into structured Record objects.
+        Parses raw GEDCOM file lines into structured Record objects. The lines are consumed
+        one at a time, so a generator reading from the file can be passed in directly.
         Args:
-            raw_file_lines (List[str]): List of raw lines from the GEDCOM file.
+            raw_file_lines (Iterable[str]): Raw lines from the GEDCOM file.
         Returns:
             List[entity.Record] | None: A list of parsed Record objects if successful, otherwise None if an error occurs.
         '''
@@ -144,26 +146,28 @@ class ParseEngine:
                 self._error = f'Invalid cross reference id {cross_ref_id} in line {line_num}'
                 return None
 
-        # Next token must be a tag
+        # Next token must be a tag. Tags repeat on nearly every line, so interning
+        # lets all records share one string per tag instead of one per line
+        tag: str = sys.intern(tokens[i])
         allow_redefined: bool = True
-        if utils.is_valid_tag(tokens[i]) or utils.is_user_defined_tag(tokens[i], allow_redefined):
-            record.tag = tokens[i]
-            match tokens[i]:
-                case enums.Tag.INDI.value:
+        if utils.is_valid_tag(tag) or utils.is_user_defined_tag(tag, allow_redefined):
+            record.tag = tag
+            match tag:
+                case enums.Tag.INDI:
                     self._indi_records.append(record)
-                case enums.Tag.FAM.value:
+                case enums.Tag.FAM:
                     self._fam_records.append(record)
-                case enums.Tag.HEAD.value:
+                case enums.Tag.HEAD:
                     self._header = record
                 case _:
                     pass
-        elif utils.is_obsolete_tag(tokens[i]):
-            record.tag = tokens[i]
+        elif utils.is_obsolete_tag(tag):
+            record.tag = tag
             self._warnings.append(
-                f'Record ignored with the obsolete tag {tokens[i]} in line {line_num}')
+                f'Record ignored with the obsolete tag {tag} in line {line_num}')
             record.ignorable = True
         else:
-            self._error = f'Invalid tag {tokens[i]} in line {line_num}'
+            self._error = f'Invalid tag {tag} in line {line_num}'
             return None
 
         i += 1
@@ -215,7 +219,7 @@ class ParseEngine:
             for child in record.child_records:
                 pointer: str = child.cross_ref_ptr
                 match child.tag:
-                    case enums.Tag.HUSB.value | enums.Tag.WIFE.value | enums.Tag.CHIL.value:
+                    case enums.Tag.HUSB | enums.Tag.WIFE | enums.Tag.CHIL:
                         if pointer in self._top_level_references:
                             referenced_record: entity.Record = self._top_level_references[pointer]
                             referenced_indi: entity.Individual | None = referenced_record.individual
@@ -224,16 +228,16 @@ class ParseEngine:
                                 self._error = f'The record \'{child}\' references an individual which does not exist'
                                 return None
 
-                            if child.tag == enums.Tag.HUSB.value:
+                            if child.tag == enums.Tag.HUSB:
                                 family.parent1 = referenced_indi
-                            elif child.tag == enums.Tag.WIFE.value:
+                            elif child.tag == enums.Tag.WIFE:
                                 family.parent2 = referenced_indi
-                            elif child.tag == enums.Tag.CHIL.value:
+                            elif child.tag == enums.Tag.CHIL:
                                 family.add_child(referenced_indi)
                         else:
                             self._error = f'The record \'{child}\' references a record which does not exist'
                             return None
-                    case enums.Tag.MARR.value:
+                    case enums.Tag.MARR:
                         pass
                     case _:
                         pass
@@ -255,13 +259,13 @@ class ParseEngine:
                 record.cross_ref_id)
             for child in record.child_records:
                 match child.tag:
-                    case enums.Tag.NAME.value:
+                    case enums.Tag.NAME:
                         name: entity.Individual.Name | None = self._parse_personal_name_structure(child)
                         if not name:
                             self._error = f'Invalid name {child.line_value} for individual {record.cross_ref_id}'
                             return None
                         individual.names.append(name)
-                    case enums.Tag.SEX.value:
+                    case enums.Tag.SEX:
                         if child.line_value == '':
                             individual.sex = enums.Sex.UNKNOWN
                         elif not child.line_value in enums.Sex:
@@ -310,21 +314,21 @@ class ParseEngine:
 
         for child in record.child_records:
             match child.tag:
-                case enums.Tag.TYPE.value:
+                case enums.Tag.TYPE:
                     if child.line_value not in enums.NameType:
                         return None
                     name.type = enums.NameType(child.line_value)
-                case enums.Tag.NPFX.value:
+                case enums.Tag.NPFX:
                     name.prefix = child.line_value
-                case enums.Tag.GIVN.value:
+                case enums.Tag.GIVN:
                     name.given = child.line_value
-                case enums.Tag.NICK.value:
+                case enums.Tag.NICK:
                     name.nickname = child.line_value
-                case enums.Tag.SPFX.value:
+                case enums.Tag.SPFX:
                     name.surname_prefix = child.line_value
-                case enums.Tag.SURN.value:
+                case enums.Tag.SURN:
                     name.surname = child.line_value
-                case enums.Tag.NSFX.value:
+                case enums.Tag.NSFX:
                     name.suffix = child.line_value
                 case _:
                     pass
@@ -344,15 +348,15 @@ class ParseEngine:
         event: entity.Event = entity.Event(event_type)
         for child in record.child_records:
             match child.tag:
-                case enums.Tag.TYPE.value:
-                    event.type = child.line_value
-                case enums.Tag.DATE.value:
+                case enums.Tag.TYPE:
+                    event.classification = child.line_value
+                case enums.Tag.DATE:
                     event.date = entity.Date(child.line_value)
-                case enums.Tag.PLAC.value:
+                case enums.Tag.PLAC:
                     event.place = self.parse_place_structure(child)
-                case enums.Tag.ADDR.value:
+                case enums.Tag.ADDR:
                     event.address = self.parse_address_structure(child)
-                case enums.Tag.NOTE.value:
+                case enums.Tag.NOTE:
                     event.note = child.line_value
                 case _:
                     pass
@@ -371,9 +375,9 @@ class ParseEngine:
         place.name = record.line_value
         for child in record.child_records:
             match child.tag:
-                case enums.Tag.LATI.value:
+                case enums.Tag.LATI:
                     place.latitude = child.line_value
-                case enums.Tag.LONG.value:
+                case enums.Tag.LONG:
                     place.longitude = child.line_value
                 case _:
                     pass
@@ -391,19 +395,19 @@ class ParseEngine:
         address: entity.Address = entity.Address()
         for child in record.child_records:
             match child.tag:
-                case enums.Tag.ADR1.value:
+                case enums.Tag.ADR1:
                     address.add_address(child.line_value)
-                case enums.Tag.ADR2.value:
+                case enums.Tag.ADR2:
                     address.add_address(child.line_value)
-                case enums.Tag.ADR3.value:
+                case enums.Tag.ADR3:
                     address.add_address(child.line_value)
-                case enums.Tag.CITY.value:
+                case enums.Tag.CITY:
                     address.city = child.line_value
-                case enums.Tag.STAE.value:
+                case enums.Tag.STAE:
                     address.state = child.line_value
-                case enums.Tag.POST.value:
+                case enums.Tag.POST:
                     address.postal = child.line_value
-                case enums.Tag.CTRY.value:
+                case enums.Tag.CTRY:
                     address.country = child.line_value
                 case _:
                     pass
@@ -4,6 +4,11 @@ Utility functions for validating and parsing GEDCOM tokens.
 
 from src import enums
 
+# Membership tables for the per-line tag checks. A frozenset probe avoids
+# the Python level EnumType.__contains__ that `token in enums.Tag` runs.
+_TAG_VALUES: frozenset[str] = frozenset(tag.value for tag in enums.Tag)
+_OBSOLETE_TAG_VALUES: frozenset[str] = frozenset(tag.value for tag in enums.ObsoleteTag)
+
 
 def is_valid_level(token: str) -> bool:
     '''
@@ -72,7 +77,7 @@ def is_obsolete_tag(token: str) -> bool:
     Returns:
         bool: True if the token is an obsolete tag, False otherwise.
     '''
-    return token in enums.ObsoleteTag
+    return token in _OBSOLETE_TAG_VALUES
 
 
 def is_valid_tag(token: str) -> bool:
@@ -85,7 +90,7 @@ def is_valid_tag(token: str) -> bool:
     Returns:
         bool: True if the token is a valid tag, False otherwise.
     '''
-    return token in enums.Tag
+    return token in _TAG_VALUES
 
 
 def is_user_defined_tag(token: str, allow_redefined: bool) -> bool:
@@ -115,7 +120,7 @@ def is_user_defined_tag(token: str, allow_redefined: bool) -> bool:
         return False
 
     # Redefined tags are not allowed
-    if not allow_redefined and token.lstrip('_') in enums.Tag:
+    if not allow_redefined and token.lstrip('_') in _TAG_VALUES:
         return False
 
     return True